@@ -2,34 +2,37 @@
 # POLYMORPHISM FOR CAB BOOKING SYSTEM - PAYMENT METHODS
 # ============================================================
 
-from abc import ABC, abstractmethod
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict
 
 # Define the PaymentMethod interface
-class PaymentMethod(ABC):
-    """Abstract base class for all payment methods"""
+class PaymentMethod:
+    """
+    Base class for all payment methods.
+    Plain class (no ABCMeta) with empty __slots__ so instances stay tiny.
+    """
+    __slots__ = ()
     
-    @abstractmethod
     def validate(self, amount: float) -> bool:
         """Validate if payment can be processed"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def pay(self, amount: float) -> str:
         """Process payment and return confirmation"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_transaction_fee(self, amount: float) -> float:
         """Calculate transaction fee for this payment method"""
-        pass
+        raise NotImplementedError
 
 
 # Concrete Payment Implementations
 class UPIPayment(PaymentMethod):
     """Unified Payments Interface - 0% transaction fee"""
+    __slots__ = ()
     TRANSACTION_FEE_PERCENT = 0.0
+    _FEE_FRACTION = TRANSACTION_FEE_PERCENT / 100
     MIN_AMOUNT = 1.0
     MAX_AMOUNT = 100000.0
     
@@ -39,18 +42,22 @@ class UPIPayment(PaymentMethod):
     
     def pay(self, amount: float) -> str:
         """Process UPI payment"""
-        if not self.validate(amount):
-            raise ValueError(f"UPI payment must be between ₹{self.MIN_AMOUNT} and ₹{self.MAX_AMOUNT}")
+        # Bounds checked inline through locals rather than via validate()
+        lo, hi = self.MIN_AMOUNT, self.MAX_AMOUNT
+        if not lo <= amount <= hi:
+            raise ValueError(f"UPI payment must be between ₹{lo} and ₹{hi}")
         return f"Paid ₹{amount} using UPI"
     
     def get_transaction_fee(self, amount: float) -> float:
         """UPI has no transaction fee"""
-        return 0.0
+        return amount * self._FEE_FRACTION
 
 
 class CardPayment(PaymentMethod):
     """Credit/Debit Card - 1.5% transaction fee"""
+    __slots__ = ()
     TRANSACTION_FEE_PERCENT = 1.5
+    _FEE_FRACTION = TRANSACTION_FEE_PERCENT / 100
     MIN_AMOUNT = 10.0
     MAX_AMOUNT = 500000.0
     
@@ -60,18 +67,22 @@ class CardPayment(PaymentMethod):
     
     def pay(self, amount: float) -> str:
         """Process card payment"""
-        if not self.validate(amount):
-            raise ValueError(f"Card payment must be between ₹{self.MIN_AMOUNT} and ₹{self.MAX_AMOUNT}")
+        # Bounds checked inline through locals rather than via validate()
+        lo, hi = self.MIN_AMOUNT, self.MAX_AMOUNT
+        if not lo <= amount <= hi:
+            raise ValueError(f"Card payment must be between ₹{lo} and ₹{hi}")
         return f"Paid ₹{amount} using Card"
     
     def get_transaction_fee(self, amount: float) -> float:
         """Calculate card transaction fee"""
-        return amount * (self.TRANSACTION_FEE_PERCENT / 100)
+        return amount * self._FEE_FRACTION
 
 
 class WalletPayment(PaymentMethod):
     """In-app Wallet - 0.5% transaction fee"""
+    __slots__ = ()
     TRANSACTION_FEE_PERCENT = 0.5
+    _FEE_FRACTION = TRANSACTION_FEE_PERCENT / 100
     MIN_AMOUNT = 5.0
     MAX_AMOUNT = 50000.0
     
@@ -81,13 +92,67 @@ class WalletPayment(PaymentMethod):
     
     def pay(self, amount: float) -> str:
         """Process wallet payment"""
-        if not self.validate(amount):
-            raise ValueError(f"Wallet payment must be between ₹{self.MIN_AMOUNT} and ₹{self.MAX_AMOUNT}")
+        # Bounds checked inline through locals rather than via validate()
+        lo, hi = self.MIN_AMOUNT, self.MAX_AMOUNT
+        if not lo <= amount <= hi:
+            raise ValueError(f"Wallet payment must be between ₹{lo} and ₹{hi}")
         return f"Paid ₹{amount} using Wallet"
     
     def get_transaction_fee(self, amount: float) -> float:
         """Calculate wallet transaction fee"""
-        return amount * (self.TRANSACTION_FEE_PERCENT / 100)
+        return amount * self._FEE_FRACTION
+
+
+# ============================================================
+# TRANSACTION FEE CACHE (opt-in)
+# ============================================================
+
+_FEE_CLASSES = (UPIPayment, CardPayment, WalletPayment)
+
+# The direct get_transaction_fee of each class, restored by disable_fee_cache()
+_DIRECT_FEE_FNS = {cls: cls.get_transaction_fee for cls in _FEE_CLASSES}
+
+# get_transaction_fee implementations known to be amount * _FEE_FRACTION
+_PERCENT_FEE_FNS = set(_DIRECT_FEE_FNS.values())
+
+
+def _has_percent_fee(payment_method: PaymentMethod) -> bool:
+    """True if payment_method's fee is exactly amount * _FEE_FRACTION"""
+    return type(payment_method).get_transaction_fee in _PERCENT_FEE_FNS
+
+
+def _compute_fee(method_cls: type, amount: float) -> float:
+    return amount * method_cls._FEE_FRACTION
+
+
+def enable_fee_cache(maxsize: int = 4096) -> None:
+    """
+    Memoize fees per (payment class, amount) for repeated fares by
+    swapping a cached get_transaction_fee onto the payment classes.
+    The default, uncached path stays a single multiply.
+    Call disable_fee_cache() first if a class's _FEE_FRACTION changes.
+    """
+    cached_fee = lru_cache(maxsize=maxsize)(_compute_fee)
+
+    def get_transaction_fee(self, amount: float) -> float:
+        """Cached transaction fee for this payment method"""
+        return cached_fee(type(self), amount)
+
+    _PERCENT_FEE_FNS.add(get_transaction_fee)
+    for cls in _FEE_CLASSES:
+        cls.get_transaction_fee = get_transaction_fee
+
+
+def disable_fee_cache() -> None:
+    """Go back to computing every fee directly"""
+    for cls, fee_fn in _DIRECT_FEE_FNS.items():
+        cls.get_transaction_fee = fee_fn
+
+
+# Shared stateless instances - reuse these instead of constructing per booking
+UPI = UPIPayment()
+CARD = CardPayment()
+WALLET = WalletPayment()
 
 
 # ============================================================
@@ -100,9 +165,9 @@ if __name__ == "__main__":
     
     # Test all payment methods
     payment_methods = [
-        ("UPI", UPIPayment()),
-        ("Card", CardPayment()),
-        ("Wallet", WalletPayment())
+        ("UPI", UPI),
+        ("Card", CARD),
+        ("Wallet", WALLET)
     ]
     
     test_amount = 500
@@ -0,0 +1,15 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# ============================================================
+# C PRICING KERNEL - ahead-of-time alternative to Numba
+# ============================================================
+#
+# Build in place (produces _pricing.*.so next to this file):
+#     cythonize -i _pricing.pyx
+#
+# strategy_checkout.py picks this up when the extension is importable
+# and falls back to Numba/Python otherwise.
+
+
+cpdef double fare(double base, double rate, double distance) nogil:
+    """Fare for a single ride: base + rate * distance"""
+    return base + rate * distance
@@ -5,48 +5,47 @@
 # ============================================================
 
 from abc import ABC, abstractmethod
+from itertools import count
 import sys
 import os
-import importlib.util
+
+# Set UTF-8 encoding for console output once, keeping the same stream
+# (captured streams, e.g. under pytest, may not support reconfigure)
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(encoding='utf-8', line_buffering=True)
 
 # Setup path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 
-# Function to import modules with hyphens in names
-def import_module_from_file(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
-
-# Import from strategy-checkout (pricing)
-strategy_module = import_module_from_file(
-    "strategy_checkout",
-    os.path.join(current_dir, "strategy-checkout.py")
-)
-PricingStrategy = strategy_module.PricingStrategy
-NormalPricing = strategy_module.NormalPricing
-SurgePricing = strategy_module.SurgePricing
-
-# Import from decorator-login (auth & logging)
-decorator_module = import_module_from_file(
-    "decorator_login",
-    os.path.join(current_dir, "decorator-login.py")
-)
-User = decorator_module.User
-login_required = decorator_module.login_required
-logging_decorator = decorator_module.logging_decorator
-validate_input = decorator_module.validate_input
-audit_decorator = decorator_module.audit_decorator
-# Import from singleton_app (config)
+# Sibling modules (pricing, auth & logging, config)
 sys.path.insert(0, current_dir)
-from singleton_app import AppConfig
+from strategy_checkout import PricingStrategy, NORMAL, SURGE
+from decorator_login import User, booking_pipeline, batch_booking_pipeline
+from singleton_app import AppConfig, _AppConfig
 
-# Import from polymorphism (payments)
+# Import from polymorphism (payments) - "class" is a keyword, so the
+# folder can't be a package and stays on sys.path instead
 sys.path.insert(0, os.path.join(parent_dir, 'class'))
-from polymorphism import PaymentMethod, UPIPayment, CardPayment, WalletPayment
+from polymorphism import PaymentMethod, UPI, CARD, WALLET, _has_percent_fee
+
+
+# Process-wide booking sequence: unique and monotonic, unlike a
+# millisecond timestamp folded into 5 digits
+_BOOKING_COUNTER = count(1)
+
+_BAR = "=" * 60
+_CONFIRM_TEMPLATE = (
+    "\n{bar}\n"
+    "{app}\n"
+    "{bar}\n"
+    "Booking ID: {bid}\n"
+    "Passenger: {user}\n"
+    "Distance: {dist} km\n"
+    "Fare: {cur}{fare}\n"
+    "Payment: {pay}\n"
+    "{bar}\n"
+)
 
 
 # ============================================================
@@ -62,13 +61,12 @@ class CabBookingService:
     - Open/Closed Principle: Can add new pricing/payment without modifying this class
     """
     
-    def __init__(self, config: AppConfig):
+    def __init__(self, config: _AppConfig):
         self.config = config
+        # app_name is a restricted setting, so it can't change after this
+        self._app_name = config.app_name
     
-    @audit_decorator
-    @validate_input
-    @login_required
-    @logging_decorator
+    @booking_pipeline
     def book_ride(self, user: User, distance_km: float, 
                   pricing_strategy: PricingStrategy, 
                   payment_method: PaymentMethod) -> str:
@@ -78,11 +76,11 @@ class CabBookingService:
         This method is the "core" and should NOT be modified internally later.
         It orchestrates pricing and payment through injected strategies.
         
-        Decorators (applied without modifying logic):
-        - @audit_decorator: Records transaction for compliance
-        - @validate_input: Validates distance and parameters
-        - @login_required: Ensures user is authenticated
-        - @logging_decorator: Logs execution with timing
+        @booking_pipeline (applied without modifying logic) fuses:
+        - audit: Records transaction for compliance
+        - validation: Validates distance and parameters
+        - login check: Ensures user is authenticated
+        - logging: Logs execution with timing
         
         Args:
             user: Authenticated user object
@@ -100,25 +98,62 @@ class CabBookingService:
         payment_confirmation = payment_method.pay(fare)
         
         # Generate booking confirmation
-        booking_id = self._generate_booking_id()
-        confirmation = (
-            f"\n{'='*60}\n"
-            f"{self.config.app_name}\n"
-            f"{'='*60}\n"
-            f"Booking ID: {booking_id}\n"
-            f"Passenger: {user.username}\n"
-            f"Distance: {distance_km} km\n"
-            f"Fare: {self.config.currency}{fare}\n"
-            f"Payment: {payment_confirmation}\n"
-            f"{'='*60}\n"
-        )
+        return self._build_confirmation(user, distance_km, fare, payment_confirmation)
+    
+    @batch_booking_pipeline
+    def book_ride_batch(self, users: list, distances,
+                        pricing_strategy: PricingStrategy,
+                        payment_method: PaymentMethod) -> tuple:
+        """
+        Book many rides in one pass (e.g. nightly billing of N trips).
         
-        return confirmation
+        Fares and fees are computed for the whole distances array at once;
+        only the confirmation strings are built ride by ride.
+        
+        @batch_booking_pipeline runs the same audit, validation, auth and
+        logging as book_ride, once per batch.
+        
+        Args:
+            users: One authenticated user per ride
+            distances: Ride distances in kilometers (array-like)
+            pricing_strategy: Strategy for calculating fares
+            payment_method: Strategy for processing payments
+            
+        Returns:
+            (confirmations, fares, fees) - a list of strings and two arrays
+        """
+        fares = pricing_strategy.calculate_fares(distances)
+        if _has_percent_fee(payment_method):
+            fees = fares * payment_method._FEE_FRACTION
+        else:
+            # Any other fee rule only promises get_transaction_fee()
+            fees = fares.copy()
+            fees[:] = [payment_method.get_transaction_fee(fare) for fare in fares.tolist()]
+        
+        pay_fn = payment_method.pay
+        confirmations = [
+            self._build_confirmation(user, distance_km, fare, pay_fn(fare))
+            for user, distance_km, fare in zip(users, distances.tolist(), fares.tolist())
+        ]
+        return confirmations, fares, fees
+    
+    def _build_confirmation(self, user: User, distance_km: float, fare: float,
+                            payment_confirmation: str) -> str:
+        """Format the booking confirmation shown to the passenger"""
+        return _CONFIRM_TEMPLATE.format_map({
+            "bar": _BAR,
+            "app": self._app_name,
+            "bid": self._generate_booking_id(),
+            "user": user.username,
+            "dist": distance_km,
+            "cur": self.config.currency,
+            "fare": fare,
+            "pay": payment_confirmation,
+        })
     
     def _generate_booking_id(self) -> str:
         """Generate a unique booking ID"""
-        import time
-        return f"BOOKING_{int(time.time() * 1000) % 100000}"
+        return f"BOOKING_{next(_BOOKING_COUNTER):05d}"
 
 
 # ============================================================
@@ -135,10 +170,6 @@ def main():
     - SOLID Principles
     """
     
-    # Set UTF-8 encoding for console output
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    
     print("\n" + "="*60)
     print("MINI CAB BOOKING SYSTEM - DEMONSTRATION")
     print("="*60 + "\n")
@@ -160,8 +191,8 @@ def main():
     result1 = booking_service.book_ride(
         user=user,
         distance_km=5.0,
-        pricing_strategy=NormalPricing(),
-        payment_method=UPIPayment()
+        pricing_strategy=NORMAL,
+        payment_method=UPI
     )
     print(result1)
     
@@ -173,8 +204,8 @@ def main():
     result2 = booking_service.book_ride(
         user=user,
         distance_km=10.0,
-        pricing_strategy=SurgePricing(),
-        payment_method=CardPayment()
+        pricing_strategy=SURGE,
+        payment_method=CARD
     )
     print(result2)
     
@@ -186,8 +217,8 @@ def main():
     result3 = booking_service.book_ride(
         user=user,
         distance_km=3.5,
-        pricing_strategy=NormalPricing(),
-        payment_method=WalletPayment()
+        pricing_strategy=NORMAL,
+        payment_method=WALLET
     )
     print(result3)
     
@@ -200,6 +231,7 @@ def main():
     # Create a custom pricing strategy
     class EconomyPricing(PricingStrategy):
         """Budget-friendly pricing: ₹8 per km"""
+        __slots__ = ()
         BASE_FARE = 30
         PER_KM_RATE = 8
         
@@ -210,7 +242,7 @@ def main():
         user=user,
         distance_km=7.0,
         pricing_strategy=EconomyPricing(),
-        payment_method=WalletPayment()
+        payment_method=WALLET
     )
     print(result4)
     
@@ -225,8 +257,8 @@ def main():
         booking_service.book_ride(
             user=unauthenticated_user,
             distance_km=5.0,
-            pricing_strategy=NormalPricing(),
-            payment_method=UPIPayment()
+            pricing_strategy=NORMAL,
+            payment_method=UPI
         )
     except Exception as e:
         print(f"❌ Error: {e}\n")
@@ -0,0 +1,227 @@
+# ============================================================
+# DECORATOR PATTERN FOR CAB BOOKING SYSTEM - AUTH & LOGGING
+# ============================================================
+
+import functools
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for batch bookings
+    np = None
+
+from singleton_app import AppConfig
+
+class User:
+    def __init__(self, username, is_authenticated=True):
+        self.username = username
+        self.is_authenticated = is_authenticated
+
+
+# ============================================================
+# SHARED CHECKS - used by the single-purpose decorators below and
+# by booking_pipeline, so each rule lives in exactly one place
+# ============================================================
+
+_AUDIT_START = "[AUDIT] Recording booking transaction..."
+_AUDIT_DONE = "[AUDIT] Transaction recorded in audit log"
+
+
+def _check_distance(distance_km, lo, hi):
+    """
+    Raise unless distance_km is a number within [lo, hi].
+    Plain int/float take the fast exact-type path; float subclasses such
+    as np.float64 are accepted too, bools are not.
+    """
+    t = type(distance_km)
+    if t is not float and t is not int:
+        if t is bool or not isinstance(distance_km, (int, float)):
+            raise TypeError(f"[VALIDATION] Distance must be a number, got {t}")
+    if not lo <= distance_km <= hi:
+        raise ValueError(f"[VALIDATION] Distance must be between {lo} and {hi} km, got {distance_km}")
+
+
+def _check_user(user, log_enabled):
+    """Raise unless user is present and authenticated"""
+    if user is None:
+        raise Exception("[AUTH] User parameter required")
+    if not user.is_authenticated:
+        raise Exception(f"[AUTH] Access denied: {user.username} is not authenticated")
+    if log_enabled:
+        print(f"[AUTH] {user.username} authenticated successfully")
+
+
+def _timed_call(func, args, kwargs):
+    """Call func, logging start time, duration and outcome"""
+    name = func.__name__
+    print(f"[LOG] Executing {name} at {time.strftime('%H:%M:%S')}")
+    start_ns = time.perf_counter_ns()
+    try:
+        result = func(*args, **kwargs)
+    except Exception as e:
+        duration = (time.perf_counter_ns() - start_ns) * 1e-9
+        print(f"[LOG] {name} failed after {duration:.3f}s: {str(e)}")
+        raise
+    duration = (time.perf_counter_ns() - start_ns) * 1e-9
+    print(f"[LOG] {name} completed successfully in {duration:.3f}s")
+    return result
+
+
+def logging_decorator(func):
+    """Logs function execution with timestamp and duration"""
+    # Read the flag once here so disabled logging costs nothing per call
+    if not AppConfig().enable_transaction_logging:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return _timed_call(func, args, kwargs)
+    return wrapper
+
+
+def login_required(func):
+    """Ensures user is authenticated before executing function"""
+    log_enabled = AppConfig().enable_transaction_logging
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Extract user from arguments
+        # For instance methods: args = (self, user, distance_km, pricing_strategy, payment_method)
+        # Or it could be passed as a keyword argument
+        
+        user = None
+        if len(args) >= 2:
+            user = args[1]  # Second argument after 'self'
+        elif 'user' in kwargs:
+            user = kwargs['user']
+        
+        _check_user(user, log_enabled)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def validate_input(func):
+    """Validates input parameters for booking"""
+    config = AppConfig()
+    log_enabled = config.enable_transaction_logging
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Extract distance_km from arguments
+        # args = (self, user, distance_km, pricing_strategy, payment_method)
+        if len(args) >= 3:
+            # Bounds read per call so set_config() changes apply immediately
+            _check_distance(args[2], config.min_booking_distance, config.max_booking_distance)
+        
+        if log_enabled:
+            print("[VALIDATION] Input parameters validated")
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def audit_decorator(func):
+    """Audits booking transactions for compliance"""
+    if not AppConfig().enable_audit_logging:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        print(_AUDIT_START)
+        result = func(*args, **kwargs)
+        print(_AUDIT_DONE)
+        return result
+    return wrapper
+
+
+def booking_pipeline(func):
+    """
+    Fused audit + validation + auth + logging for booking methods.
+
+    Same checks and output as stacking @audit_decorator, @validate_input,
+    @login_required and @logging_decorator (it reuses their helpers), but
+    in a single wrapper with explicit parameters instead of probing *args.
+    Log and audit flags are read once here, so disabled output costs only
+    a branch per call; distance bounds are read from the config per call.
+    """
+    config = AppConfig()
+    log_enabled = config.enable_transaction_logging
+    audit_enabled = config.enable_audit_logging
+
+    @functools.wraps(func)
+    def wrapper(self, user, distance_km, pricing_strategy, payment_method):
+        if audit_enabled:
+            print(_AUDIT_START)
+
+        _check_distance(distance_km, config.min_booking_distance, config.max_booking_distance)
+        if log_enabled:
+            print("[VALIDATION] Input parameters validated")
+
+        _check_user(user, log_enabled)
+
+        args = (self, user, distance_km, pricing_strategy, payment_method)
+        result = _timed_call(func, args, {}) if log_enabled else func(*args)
+
+        if audit_enabled:
+            print(_AUDIT_DONE)
+        return result
+    return wrapper
+
+
+
+def batch_booking_pipeline(func):
+    """
+    Batch counterpart of booking_pipeline for methods taking
+    (self, users, distances, pricing_strategy, payment_method).
+
+    Every ride gets the same checks as a single booking, vectorized over
+    the distances array; audit and log lines are emitted once per batch.
+    The wrapped method receives distances as a 1-D float64 ndarray.
+    """
+    config = AppConfig()
+    log_enabled = config.enable_transaction_logging
+    audit_enabled = config.enable_audit_logging
+
+    @functools.wraps(func)
+    def wrapper(self, users, distances, pricing_strategy, payment_method):
+        if np is None:
+            raise ImportError(f"{func.__name__} requires NumPy (pip install numpy)")
+        if audit_enabled:
+            print(_AUDIT_START)
+
+        distances = np.asarray(distances)
+        if distances.dtype.kind not in "iuf":
+            raise TypeError(f"[VALIDATION] Distances must be numbers, got {distances.dtype}")
+        distances = distances.astype(np.float64, copy=False)
+        lo, hi = config.min_booking_distance, config.max_booking_distance
+        if distances.ndim != 1 or distances.shape[0] != len(users):
+            raise ValueError("[VALIDATION] Expected one distance per user")
+        if not ((distances >= lo) & (distances <= hi)).all():
+            raise ValueError(f"[VALIDATION] All distances must be between {lo} and {hi} km")
+        if log_enabled:
+            print(f"[VALIDATION] {len(users)} rides validated")
+
+        for user in users:
+            _check_user(user, False)
+        if log_enabled:
+            print(f"[AUTH] {len(users)} users authenticated successfully")
+
+        args = (self, users, distances, pricing_strategy, payment_method)
+        result = _timed_call(func, args, {}) if log_enabled else func(*args)
+
+        if audit_enabled:
+            print(_AUDIT_DONE)
+        return result
+    return wrapper
+
+# ============================================================
+# EXAMPLE USAGE (can be removed later)
+# ============================================================
+if __name__ == "__main__":
+    @login_required
+    @logging_decorator
+    def book_ride(user, distance_km):
+        """Example function to demonstrate decorators"""
+        return f"Ride booked for {distance_km} km"
+
+    user = User(username="Alice", is_authenticated=True)
+    print(book_ride(user, 10))
\ No newline at end of file
@@ -5,10 +5,14 @@
 from typing import Dict, Any
 from datetime import datetime
 
-class AppConfig:
+# Settings that set_config() refuses to change
+_RESTRICTED = frozenset({'app_name', 'version', 'currency_code'})
+
+
+class _AppConfig:
     """
-    Singleton class for application configuration.
-    Ensures only ONE instance exists across the entire app.
+    Application configuration, created exactly once at import time.
+    Use AppConfig() to get the shared instance.
     
     This class manages all app-wide settings including:
     - App metadata (name, version)
@@ -16,28 +20,8 @@ class AppConfig:
     - Environment settings
     - Operational parameters
     """
-    _instance = None
-    _lock = False  # Simple lock for thread safety
-
-    def __new__(cls):
-        # __new__ runs BEFORE __init__
-        # It controls object creation
-
-        if cls._instance is None:
-            print("[CONFIG] Initializing AppConfig (first time)")
-            cls._instance = super().__new__(cls)
-            # Initialize attributes only on first creation
-            cls._instance._initialized = False
-        else:
-            print("[CONFIG] Reusing existing AppConfig instance")
-
-        return cls._instance
 
     def __init__(self):
-        # Guard against re-initialization
-        if self._initialized:
-            return
-        
         # ========== APP METADATA ==========
         self.app_name = "Mini Cab Booking System"
         self.version = "1.0"
@@ -58,11 +42,11 @@ class AppConfig:
         self.max_booking_fare = 50000.0  # currency units
         
         # ========== PAYMENT SETTINGS ==========
-        self.supported_payment_methods = [
+        self.supported_payment_methods = frozenset({
             "UPI",
             "Card",
             "Wallet"
-        ]
+        })
         self.payment_timeout_seconds = 30
         
         # ========== OPERATIONAL SETTINGS ==========
@@ -75,26 +59,20 @@ class AppConfig:
         self.enable_audit_logging = True
         self.enable_transaction_logging = True
         self.log_retention_days = 90
-        
-        self._initialized = True
     
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key"""
-        if hasattr(self, key):
-            return getattr(self, key)
-        return default
+        return self.__dict__.get(key, default)
     
     def set_config(self, key: str, value: Any) -> bool:
         """Set configuration value (restricted keys cannot be changed)"""
         # Protect critical settings
-        restricted_keys = ['app_name', 'version', 'currency_code']
-        
-        if key in restricted_keys:
+        if key in _RESTRICTED:
             print(f"[CONFIG] Warning: '{key}' is restricted and cannot be modified")
             return False
         
-        if hasattr(self, key):
-            setattr(self, key, value)
+        if key in self.__dict__:
+            self.__dict__[key] = value
             print(f"[CONFIG] Updated {key} = {value}")
             return True
         
@@ -102,12 +80,8 @@ class AppConfig:
         return False
     
     def get_all_config(self) -> Dict[str, Any]:
-        """Get all configuration as dictionary"""
-        config_dict = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_'):  # Exclude private attributes
-                config_dict[key] = value
-        return config_dict
+        """Get all configuration as dictionary (private attributes excluded)"""
+        return {k: v for k, v in self.__dict__.items() if k[:1] != '_'}
     
     def validate_booking_params(self, distance_km: float, fare: float) -> tuple[bool, str]:
         """Validate if booking parameters are within configured limits"""
@@ -135,11 +109,20 @@ class AppConfig:
     
     def reset_to_defaults(self) -> None:
         """Reset all configuration to defaults (for testing)"""
-        self._initialized = False
         self.__init__()
         print("[CONFIG] Reset to default configuration")
 
 
+# The single instance - module import runs once and is already
+# serialized by the import lock, so no extra locking is needed
+APP_CONFIG = _AppConfig()
+
+
+def AppConfig() -> _AppConfig:
+    """Return the shared application configuration"""
+    return APP_CONFIG
+
+
 # ============================================================
 # EXAMPLE USAGE (can be removed later)
 # ============================================================
@@ -174,7 +157,7 @@ if __name__ == "__main__":
     
     # Check payment method support
     print("Payment Methods:")
-    for method in config1.supported_payment_methods:
+    for method in sorted(config1.supported_payment_methods):
         print(f"  ✓ {method}")
     print()
     
@@ -0,0 +1,126 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for batch pricing
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional - fall back to Python/NumPy kernels
+    njit = None
+
+
+# ============================================================
+# FARE KERNELS (Cython if built, else Numba - cached on disk)
+# ============================================================
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _fare_scalar(base, rate, distance):
+        """Fare for a single ride: base + rate * distance"""
+        return float(base + rate * distance)
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _fare_batch(base, rate, distances, out):
+        """Fill `out` with the fare for every distance in `distances`"""
+        for i in prange(distances.shape[0]):
+            out[i] = base + rate * distances[i]
+else:
+    def _fare_scalar(base, rate, distance):
+        """Fare for a single ride: base + rate * distance"""
+        return float(base + rate * distance)
+
+    def _fare_batch(base, rate, distances, out):
+        """Fill `out` with one vectorized NumPy expression"""
+        out[:] = base + rate * distances
+
+# Every _fare_scalar returns a float, matching the Cython kernel's
+# `double`, so fares format the same whichever kernel is active
+try:
+    # Prebuilt Cython kernel: C speed without Numba's JIT warmup
+    from _pricing import fare as _fare_scalar
+except ImportError:
+    pass
+
+
+# ============================================================
+# PRICING STRATEGY PATTERN FOR CAB BOOKING SYSTEM
+# ============================================================
+
+#The "Algorithm" Blueprint (Interface)
+class PricingStrategy:
+    __slots__ = ()
+
+    def calculate_fare(self, distance_km):
+        """All pricing strategies must implement this method"""
+        raise NotImplementedError
+
+    def calculate_fares(self, distances):
+        """
+        Calculate fares for an array-like of distances.
+        Strategies using a known linear calculate_fare are priced in one
+        vectorized pass; any other rule is applied fare by fare.
+        """
+        if np is None:
+            raise ImportError("calculate_fares requires NumPy (pip install numpy)")
+        distances = np.asarray(distances, dtype=np.float64)
+        if type(self).calculate_fare not in _LINEAR_FARE_FNS:
+            return np.fromiter(map(self.calculate_fare, distances.tolist()),
+                               dtype=np.float64, count=len(distances))
+        out = np.empty(distances.shape[0], dtype=np.float64)
+        _fare_batch(self.BASE_FARE, self.PER_KM_RATE, distances, out)
+        return out
+
+
+# The Concrete Pricing Strategies
+class NormalPricing(PricingStrategy):
+    """Standard pricing: ₹10 per km"""
+    __slots__ = ()
+    BASE_FARE = 50  # Base amount
+    PER_KM_RATE = 10
+    
+    def calculate_fare(self, distance_km):
+        return _fare_scalar(self.BASE_FARE, self.PER_KM_RATE, distance_km)
+
+
+class SurgePricing(PricingStrategy):
+    """Surge pricing: ₹25 per km (peak hours)"""
+    __slots__ = ()
+    BASE_FARE = 100
+    PER_KM_RATE = 25
+    
+    def calculate_fare(self, distance_km):
+        return _fare_scalar(self.BASE_FARE, self.PER_KM_RATE, distance_km)
+
+
+# calculate_fare implementations that are exactly BASE_FARE + PER_KM_RATE * d,
+# so calculate_fares can hand them to _fare_batch
+_LINEAR_FARE_FNS = {NormalPricing.calculate_fare, SurgePricing.calculate_fare}
+
+
+# Shared stateless instances - reuse these instead of constructing per booking
+NORMAL = NormalPricing()
+SURGE = SurgePricing()
+
+
+# The Context (The Booking)
+class Booking:
+    def __init__(self, distance_km, strategy: PricingStrategy):
+        self.distance_km = distance_km
+        self.strategy = strategy  # This is the "brain" that can be swapped!
+
+    def calculate_price(self):
+        # The Booking doesn't know the pricing logic; it asks the Strategy
+        return self.strategy.calculate_fare(self.distance_km)
+
+
+# ============================================================
+# EXAMPLE USAGE (can be removed later)
+# ============================================================
+if __name__ == "__main__":
+    # Initial choice: Normal Pricing
+    booking = Booking(distance_km=5, strategy=NORMAL)
+    print(f"Normal Pricing for 5 km: ₹{booking.calculate_price()}")
+
+    # Change strategy at runtime (Surge pricing during peak hours)
+    booking.strategy = SURGE
+    print(f"Surge Pricing for 5 km: ₹{booking.calculate_price()}")
\ No newline at end of file